@@ -3,7 +3,6 @@ from typing import Any
 import fire  # type: ignore
 
 from .auth import cli as auth_cli
-from .server import run
 
 
 class CLI:
@@ -11,9 +10,11 @@ class CLI:
         self.auth = auth_cli.AuthCLI()
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
-        return run(*args, **kwargs)
+        return self.run(*args, **kwargs)
 
     def run(self, *args: Any, **kwargs: Any) -> Any:
+        from .server import run
+
         return run(*args, **kwargs)
 
 
@@ -1,16 +1,110 @@
 import asyncio
+import hashlib
 import logging
+import threading
 from collections.abc import Awaitable
-from typing import Callable
+from datetime import datetime
+from typing import Callable, Dict, Optional
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse, Response
 
-from academia_mcp.auth.token_manager import update_last_used, validate_token
+from academia_mcp.auth.models import TokenMetadata
+from academia_mcp.auth.token_manager import bulk_update_last_used, validate_token
+from academia_mcp.utils import TTLCache
 
 logger = logging.getLogger(__name__)
 
+TOKEN_CACHE_TTL = 60.0
+TOKEN_CACHE_MAX_SIZE = 10_000
+LAST_USED_FLUSH_INTERVAL = 5.0
+BEARER_PREFIX = "bearer "
+MAX_TOKEN_LENGTH = 512
+MAX_AUTH_HEADER_LENGTH = MAX_TOKEN_LENGTH + 8
+
+
+class TokenValidationCache:
+    def __init__(self, ttl: float = TOKEN_CACHE_TTL, max_size: int = TOKEN_CACHE_MAX_SIZE) -> None:
+        self._cache: TTLCache[TokenMetadata] = TTLCache(ttl=ttl, max_size=max_size)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+    def get(self, token: str) -> Optional[TokenMetadata]:
+        key = self._key(token)
+        metadata = self._cache.get(key)
+        if metadata is None:
+            return None
+        if metadata.expires_at is not None and datetime.utcnow() > metadata.expires_at:
+            self._cache.delete(key)
+            return None
+        return metadata
+
+    def set(self, token: str, metadata: TokenMetadata) -> None:
+        self._cache.set(self._key(token), metadata)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+token_cache = TokenValidationCache()
+
+
+def validate_token_cached(token: str) -> Optional[TokenMetadata]:
+    metadata = token_cache.get(token)
+    if metadata is not None:
+        return metadata
+    metadata = validate_token(token)
+    if metadata is not None:
+        token_cache.set(token, metadata)
+    return metadata
+
+
+class LastUsedBuffer:
+    def __init__(self, flush_interval: float = LAST_USED_FLUSH_INTERVAL) -> None:
+        self.flush_interval = flush_interval
+        self._pending: Dict[str, datetime] = {}
+        self._task: Optional[asyncio.Task[None]] = None
+        self._write_lock = threading.Lock()
+
+    def record(self, token: str) -> None:
+        self._pending[token] = datetime.utcnow()
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._flush_periodically())
+
+    async def flush(self) -> None:
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, {}
+        await asyncio.to_thread(self._write, pending)
+
+    def _write(self, pending: Dict[str, datetime]) -> None:
+        with self._write_lock:
+            bulk_update_last_used(pending)
+
+    async def close(self) -> None:
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+        await self.flush()
+
+    async def _flush_periodically(self) -> None:
+        while self._pending:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+
+last_used_buffer = LastUsedBuffer()
+
+
+def _has_bearer_prefix(auth_header: str) -> bool:
+    if auth_header.startswith(("Bearer ", "bearer ")):
+        return True
+    return auth_header[: len(BEARER_PREFIX)].lower() == BEARER_PREFIX
+
 
 class BearerTokenAuthMiddleware(BaseHTTPMiddleware):
     async def dispatch(
@@ -37,9 +131,11 @@ class BearerTokenAuthMiddleware(BaseHTTPMiddleware):
                     headers={"WWW-Authenticate": 'Bearer realm="MCP API"'},
                 )
 
-            parts = auth_header.split()
-            if len(parts) != 2 or parts[0].lower() != "bearer":
-                logger.debug(f"Invalid Authorization header format: {auth_header}")
+            token = ""
+            if len(auth_header) <= MAX_AUTH_HEADER_LENGTH and _has_bearer_prefix(auth_header):
+                token = auth_header[len(BEARER_PREFIX) :].strip()
+            if not token or " " in token:
+                logger.debug(f"Invalid Authorization header format: {auth_header[:32]}...")
                 return JSONResponse(
                     status_code=401,
                     content={
@@ -48,10 +144,11 @@ class BearerTokenAuthMiddleware(BaseHTTPMiddleware):
                     headers={"WWW-Authenticate": 'Bearer realm="MCP API"'},
                 )
 
-            token = parts[1]
             logger.debug("Using token from Authorization header")
 
-        metadata = validate_token(token)
+        metadata = None
+        if len(token) <= MAX_TOKEN_LENGTH:
+            metadata = validate_token_cached(token)
         if metadata is None:
             logger.debug(f"Invalid or expired token: {token[:16]}...")
             return JSONResponse(
@@ -62,13 +159,7 @@ class BearerTokenAuthMiddleware(BaseHTTPMiddleware):
 
         request.state.token_metadata = metadata
 
-        asyncio.create_task(self._update_last_used_async(token))
+        last_used_buffer.record(token)
 
         logger.debug(f"Authenticated request for client_id={metadata.client_id}")
         return await call_next(request)
-
-    async def _update_last_used_async(self, token: str) -> None:
-        try:
-            update_last_used(token)
-        except Exception as e:
-            logger.warning(f"Failed to update last_used for token: {e}")
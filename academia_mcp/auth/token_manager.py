@@ -3,7 +3,7 @@ import logging
 import secrets
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from academia_mcp.auth.models import TokenMetadata, TokenStore
 from academia_mcp.settings import settings
@@ -155,3 +155,19 @@ def update_last_used(token_id: str, path: Optional[Path] = None) -> None:
             save_tokens(store, path)
     except Exception as e:
         logger.warning(f"Failed to update last_used for {token_id[:16]}...: {e}")
+
+
+def bulk_update_last_used(last_used: Dict[str, datetime], path: Optional[Path] = None) -> None:
+    if not last_used:
+        return
+    try:
+        store = load_tokens(path)
+        updated = False
+        for token_id, timestamp in last_used.items():
+            if token_id in store.tokens:
+                store.tokens[token_id].last_used = timestamp
+                updated = True
+        if updated:
+            save_tokens(store, path)
+    except Exception as e:
+        logger.warning(f"Failed to update last_used for {len(last_used)} tokens: {e}")
@@ -1,5 +1,7 @@
-from typing import Any, Dict, List, TypeVar
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple, TypeVar
 
+import httpx
 from openai import AsyncOpenAI
 from openai.types.chat.chat_completion_message import ChatCompletionMessage
 from pydantic import BaseModel
@@ -16,13 +18,57 @@ class ChatMessage(BaseModel):  # type: ignore
 
 ChatMessages = List[ChatMessage]
 
+_clients: Dict[Tuple[Optional[str], Optional[str]], AsyncOpenAI] = {}
+_clients_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _release_clients(
+    loop: Optional[asyncio.AbstractEventLoop],
+    clients: Dict[Tuple[Optional[str], Optional[str]], AsyncOpenAI],
+) -> None:
+    if loop is None or not loop.is_running():
+        # close() cannot run on a stopped loop; such pools are freed when the clients are collected
+        return
+    for client in clients.values():
+        asyncio.run_coroutine_threadsafe(client.close(), loop)
+
+
+def get_async_client(api_key: Optional[str], base_url: Optional[str] = None) -> AsyncOpenAI:
+    global _clients, _clients_loop
+    loop = asyncio.get_running_loop()
+    if _clients_loop is not loop:
+        _release_clients(_clients_loop, _clients)
+        _clients, _clients_loop = {}, loop
+    client_key = (base_url, api_key)
+    client = _clients.get(client_key)
+    if client is None:
+        client = AsyncOpenAI(
+            base_url=base_url,
+            api_key=api_key,
+            timeout=httpx.Timeout(settings.LLM_TIMEOUT, connect=settings.LLM_CONNECT_TIMEOUT),
+            max_retries=settings.LLM_MAX_RETRIES,
+        )
+        _clients[client_key] = client
+    return client
+
+
+async def close_async_clients() -> None:
+    global _clients, _clients_loop
+    clients, loop = _clients, _clients_loop
+    _clients, _clients_loop = {}, None
+    if loop is not asyncio.get_running_loop():
+        _release_clients(loop, clients)
+        return
+    for client in clients.values():
+        await client.close()
+
 
 async def llm_acall(model_name: str, messages: ChatMessages, **kwargs: Any) -> str:
     key = settings.OPENROUTER_API_KEY
     assert key, "Please set OPENROUTER_API_KEY in the environment variables"
     base_url = settings.BASE_URL
 
-    client = AsyncOpenAI(base_url=base_url, api_key=key)
+    client = get_async_client(api_key=key, base_url=base_url)
     response: ChatCompletionMessage = (
         (
             await client.chat.completions.create(
@@ -49,7 +95,7 @@ async def llm_acall_structured(
     assert key, "Please set OPENROUTER_API_KEY in the environment variables"
     base_url = settings.BASE_URL
 
-    client = AsyncOpenAI(base_url=base_url, api_key=key)
+    client = get_async_client(api_key=key, base_url=base_url)
     converted_messages = [message.model_dump() for message in messages]
     for retry_index in range(num_parsing_retries):
         try:
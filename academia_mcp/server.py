@@ -1,17 +1,21 @@
+import asyncio
 import logging
 import socket
+from contextlib import asynccontextmanager
 from logging.config import dictConfig
-from typing import Literal, Optional
+from typing import Any, AsyncIterator, Literal, Optional
 
 import fire  # type: ignore
 import uvicorn
 from mcp.server.fastmcp import FastMCP
 from mcp.server.transport_security import TransportSecuritySettings
+from starlette.applications import Starlette
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 from uvicorn.config import LOGGING_CONFIG as UVICORN_LOGGING_CONFIG
 
-from academia_mcp.auth.middleware import BearerTokenAuthMiddleware
+from academia_mcp.auth.middleware import BearerTokenAuthMiddleware, last_used_buffer
+from academia_mcp.llm import close_async_clients
 from academia_mcp.settings import settings
 from academia_mcp.tools.anthology_search import anthology_search
 from academia_mcp.tools.arxiv_download import arxiv_download
@@ -63,6 +67,35 @@ def find_free_port() -> int:
     raise RuntimeError("No free port in range 5000-6000 found")
 
 
+async def _run_shutdown_hooks() -> None:
+    await last_used_buffer.close()
+    await close_async_clients()
+
+
+def add_shutdown_hooks(app: Starlette) -> None:
+    lifespan = app.router.lifespan_context
+
+    @asynccontextmanager
+    async def lifespan_with_shutdown_hooks(app: Starlette) -> AsyncIterator[Any]:
+        async with lifespan(app) as state:
+            try:
+                yield state
+            finally:
+                await _run_shutdown_hooks()
+
+    app.router.lifespan_context = lifespan_with_shutdown_hooks
+
+
+async def _run_with_shutdown_hooks(server: FastMCP, transport: Literal["stdio", "sse"]) -> None:
+    try:
+        if transport == "stdio":
+            await server.run_stdio_async()
+        else:
+            await server.run_sse_async()
+    finally:
+        await _run_shutdown_hooks()
+
+
 def create_server(
     streamable_http_path: str = "/mcp",
     mount_path: str = "/",
@@ -165,6 +198,7 @@ def run(
 
     if transport == "streamable-http":
         app = server.streamable_http_app()
+        add_shutdown_hooks(app)
 
         # Add auth middleware BEFORE CORS if enabled
         if settings.ENABLE_AUTH:
@@ -192,7 +226,7 @@ def run(
             forwarded_allow_ips="*",
         )
     else:
-        server.run(transport=transport)
+        asyncio.run(_run_with_shutdown_hooks(server, transport))
 
 
 if __name__ == "__main__":
@@ -21,6 +21,9 @@ class Settings(BaseSettings):
     DOCUMENT_QA_QUESTION_MAX_LENGTH: int = 10000
     DOCUMENT_QA_DOCUMENT_MAX_LENGTH: int = 200000
     DESCRIBE_IMAGE_MODEL_NAME: str = "gpt-4.1"
+    LLM_TIMEOUT: float = 600.0
+    LLM_CONNECT_TIMEOUT: float = 5.0
+    LLM_MAX_RETRIES: int = 2
 
     WEBSHARE_PROXY_USERNAME: Optional[str] = None
     WEBSHARE_PROXY_PASSWORD: Optional[str] = None
@@ -33,6 +36,7 @@ class Settings(BaseSettings):
 
     S2_PROXY_ENABLED: bool = False
     S2_MAX_RETRIES: int = 3
+    S2_MAX_CONCURRENT_REQUESTS: int = 4
     PROXY_LIST_FILE: Path = Path.cwd() / "proxies.txt"
 
     model_config = SettingsConfigDict(
@@ -2,6 +2,7 @@
 # https://github.com/jonatasgrosman/findpapers/blob/master/findpapers/searchers/arxiv_searcher.py
 # https://info.arxiv.org/help/api/user-manual.html
 
+import functools
 import re
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional, Union
@@ -13,6 +14,7 @@ from academia_mcp.utils import get_with_retries
 
 BASE_URL = "http://export.arxiv.org"
 URL_TEMPLATE = "{base_url}/api/query?search_query={query}&start={start}&sortBy={sort_by}&sortOrder={sort_order}&max_results={limit}"
+ID_LIST_URL_TEMPLATE = "{base_url}/api/query?id_list={paper_id}&max_results=1"
 SORT_BY_OPTIONS = ("relevance", "lastUpdatedDate", "submittedDate")
 SORT_ORDER_OPTIONS = ("ascending", "descending")
 
@@ -45,10 +47,9 @@ def _format_authors(authors: Union[List[Dict[str, str]], Dict[str, str]]) -> str
         return ""
     if isinstance(authors, dict):
         authors = [authors]
-    names = [author["name"] for author in authors]
-    result = ", ".join(names[:3])
-    if len(names) > 3:
-        result += f", and {len(names) - 3} more authors"
+    result = ", ".join(author["name"] for author in authors[:3])
+    if len(authors) > 3:
+        result += f", and {len(authors) - 3} more authors"
     return result
 
 
@@ -227,3 +228,19 @@ def arxiv_search(
         total_results=total_results,
         include_abstracts=include_abstracts,
     )
+
+
+@functools.lru_cache(maxsize=1024)
+def arxiv_get_abstract(arxiv_id: str) -> str:
+    assert isinstance(arxiv_id, str), "Error: Your arxiv_id must be a string"
+    assert arxiv_id.strip(), "Error: Your arxiv_id should not be empty"
+    url = ID_LIST_URL_TEMPLATE.format(base_url=BASE_URL, paper_id=arxiv_id.strip())
+    response = get_with_retries(url)
+    parsed_content = xmltodict.parse(response.content)
+    entry = parsed_content.get("feed", {}).get("entry")
+    if isinstance(entry, list):
+        entry = entry[0] if entry else None
+    assert entry and entry.get("summary"), f"Error: No abstract found for {arxiv_id}"
+    is_error = "/api/errors" in str(entry.get("id", "")) or entry.get("title") == "Error"
+    assert not is_error, f"Error: {_format_text_field(entry['summary'])}"
+    return _format_text_field(entry["summary"])
@@ -2,8 +2,10 @@
 # https://arxiv.org/abs/2504.12976
 # https://web.stanford.edu/class/cs197c/slides/02-literature-search.pdf
 
+import asyncio
 import json
 import random
+import threading
 from typing import Any, Dict, List, Optional
 
 from datasets import load_dataset  # type: ignore
@@ -11,18 +13,25 @@ from pydantic import BaseModel, Field
 
 from academia_mcp.llm import ChatMessage, llm_acall_structured
 from academia_mcp.settings import settings
-from academia_mcp.tools.arxiv_download import arxiv_download
+from academia_mcp.tools.arxiv_search import arxiv_get_abstract
 from academia_mcp.utils import encode_prompt
 
 
 class ProposalDataset:
     dataset: Optional[List[Any]] = None
+    lock = threading.Lock()
 
     @classmethod
     def get_dataset(cls) -> List[Any]:
-        if cls.dataset is None:
-            cls.dataset = list(load_dataset("UniverseTBD/hypogen-dr1")["train"])
-        return cls.dataset
+        with cls.lock:
+            if cls.dataset is None:
+                cls.dataset = list(load_dataset("UniverseTBD/hypogen-dr1")["train"])
+            return cls.dataset
+
+    @classmethod
+    def warm_up(cls) -> None:
+        if cls.dataset is None and not cls.lock.locked():
+            threading.Thread(target=cls.get_dataset, daemon=True).start()
 
 
 EXTRACT_PROMPT = """
@@ -199,9 +208,9 @@ async def extract_bitflip_info(arxiv_id: str) -> BitFlipInfo:
     Args:
         arxiv_id: The arXiv ID of the paper to extract the Bit-Flip information from.
     """
+    ProposalDataset.warm_up()
     model_name = settings.BITFLIP_MODEL_NAME
-    paper = arxiv_download(arxiv_id)
-    abstract = paper.abstract
+    abstract = await asyncio.to_thread(arxiv_get_abstract, arxiv_id)
     prompt = encode_prompt(EXTRACT_PROMPT, abstract=abstract)
     bitflip_info: BitFlipInfo = await llm_acall_structured(
         model_name=model_name,
@@ -243,9 +252,9 @@ async def generate_research_proposals(
         additional_context: Additional context to use when proposing the improvement idea.
     """
     model_name = settings.BITFLIP_MODEL_NAME
-    max_completion_tokens = int(settings.BITFLIP_MAX_COMPLETION_TOKENS)
-    examples = ProposalDataset.get_dataset()[:]
-    examples = random.choices(examples, k=2)
+    max_completion_tokens = settings.BITFLIP_MAX_COMPLETION_TOKENS
+    dataset = await asyncio.to_thread(ProposalDataset.get_dataset)
+    examples = random.sample(dataset, k=2)
 
     prompt = encode_prompt(
         IMPROVEMENT_PROMPT,
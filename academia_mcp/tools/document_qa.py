@@ -1,9 +1,7 @@
 import json
-from typing import Any, Dict, List
+from typing import Any, Dict
 
-from pydantic import BaseModel
-
-from academia_mcp.llm import llm_acall
+from academia_mcp.llm import ChatMessage, llm_acall
 from academia_mcp.settings import settings
 from academia_mcp.utils import truncate_content
 
@@ -28,14 +26,6 @@ Questions (repeated):
 Your citations and answers:"""
 
 
-class ChatMessage(BaseModel):  # type: ignore
-    role: str
-    content: str | List[Dict[str, Any]]
-
-
-ChatMessages = List[ChatMessage]
-
-
 async def document_qa(
     document: str | Dict[str, Any],
     question: str,
@@ -59,7 +49,7 @@ async def document_qa(
     """
     assert question and question.strip(), "Please provide non-empty 'question'"
     if isinstance(document, dict):
-        document = json.dumps(document)
+        document = json.dumps(document, ensure_ascii=False)
     assert document and document.strip(), "Please provide non-empty 'document'"
 
     question = truncate_content(question, settings.DOCUMENT_QA_QUESTION_MAX_LENGTH)
@@ -11,7 +11,6 @@ from textwrap import dedent
 from typing import Any, Dict, List, Optional
 
 import httpx
-from paddleocr import PaddleOCR  # type: ignore
 from PIL import Image
 from pydantic import BaseModel
 
@@ -68,15 +67,17 @@ class OCRBox(BaseModel):  # type: ignore
 
 
 class OCRSingleton:
-    instance: Optional[PaddleOCR] = None
+    instance: Optional[Any] = None
     lock: threading.Lock = threading.Lock()
 
     @classmethod
-    def get(cls) -> PaddleOCR:
+    def get(cls) -> Any:
         if cls.instance is not None:
             return cls.instance
         with cls.lock:
             if cls.instance is None:
+                from paddleocr import PaddleOCR  # type: ignore
+
                 with open(os.devnull, "w") as devnull:
                     with contextlib.redirect_stderr(devnull):
                         cls.instance = PaddleOCR(
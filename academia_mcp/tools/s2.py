@@ -1,12 +1,15 @@
 # Based on
 # https://api.semanticscholar.org/api-docs/graph#tag/Paper-Data/operation/get_graph_get_paper_citations
 
+import asyncio
+import re
 from typing import Any, Dict, List, Optional
 
+import requests
 from pydantic import BaseModel, Field
 
 from academia_mcp.settings import settings
-from academia_mcp.utils import get_with_retries, load_proxies_from_file
+from academia_mcp.utils import TTLCache, get_with_retries, load_proxies_from_file
 
 BASE_URL = "https://api.semanticscholar.org/graph/v1"
 PAPER_URL_TEMPLATE = "{base_url}/paper/{paper_id}"
@@ -14,6 +17,12 @@ CITATIONS_URL_TEMPLATE = "{base_url}/paper/{paper_id}/citations"
 REFERENCES_URL_TEMPLATE = "{base_url}/paper/{paper_id}/references"
 SEARCH_URL_TEMPLATE = "{base_url}/paper/search"
 FIELDS = "paperId,title,authors,externalIds,venue,citationCount,publicationDate,citationStyles"
+_DATE_PATTERN = r"\d{4}(?:-\d{2}(?:-\d{2})?)?"
+INFO_CACHE_TTL = 3600.0
+INFO_CACHE_MAX_SIZE = 10_000
+PUBLICATION_DATE_RE = re.compile(
+    rf"^(?:{_DATE_PATTERN}(?::(?:{_DATE_PATTERN})?)?|:{_DATE_PATTERN})$"
+)
 
 
 class S2PaperInfo(BaseModel):  # type: ignore
@@ -36,6 +45,14 @@ class S2SearchResponse(BaseModel):  # type: ignore
     results: List[S2PaperInfo] = Field(description="Search entries")
 
 
+_info_cache: TTLCache[S2PaperInfo] = TTLCache(ttl=INFO_CACHE_TTL, max_size=INFO_CACHE_MAX_SIZE)
+
+
+def _copy_info(info: S2PaperInfo) -> S2PaperInfo:
+    copied_info: S2PaperInfo = info.model_copy(deep=True)
+    return copied_info
+
+
 def _format_authors(authors: List[Dict[str, Any]]) -> List[str]:
     return [a["name"] for a in authors]
 
@@ -75,6 +92,24 @@ def _format_entries(
     )
 
 
+_request_semaphore: Optional[asyncio.Semaphore] = None
+_request_semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_request_semaphore() -> asyncio.Semaphore:
+    global _request_semaphore, _request_semaphore_loop
+    loop = asyncio.get_running_loop()
+    if _request_semaphore is None or _request_semaphore_loop is not loop:
+        _request_semaphore = asyncio.Semaphore(settings.S2_MAX_CONCURRENT_REQUESTS)
+        _request_semaphore_loop = loop
+    return _request_semaphore
+
+
+async def _get(url: str, **kwargs: Any) -> requests.Response:
+    async with _get_request_semaphore():
+        return await asyncio.to_thread(get_with_retries, url, **kwargs)
+
+
 def _load_proxy_list() -> list[str]:
     proxies_list: list[str] = []
     if settings.S2_PROXY_ENABLED and settings.PROXY_LIST_FILE.exists():
@@ -82,7 +117,7 @@ def _load_proxy_list() -> list[str]:
     return proxies_list
 
 
-def s2_get_citations(
+async def s2_get_citations(
     arxiv_id: str,
     offset: int = 0,
     limit: int = 50,
@@ -106,8 +141,11 @@ def s2_get_citations(
 
     proxies_list = _load_proxy_list()
 
-    response = get_with_retries(
-        url, params=payload, num_retries=settings.S2_MAX_RETRIES, proxies_list=proxies_list
+    response = await _get(
+        url,
+        params=payload,
+        num_retries=settings.S2_MAX_RETRIES,
+        proxies_list=proxies_list,
     )
     result = response.json()
     entries = result["data"]
@@ -116,7 +154,7 @@ def s2_get_citations(
     if "next" in result:
         paper_url = PAPER_URL_TEMPLATE.format(base_url=BASE_URL, paper_id=paper_id)
         payload = {"fields": FIELDS}
-        paper_response = get_with_retries(
+        paper_response = await _get(
             paper_url,
             params=payload,
             num_retries=settings.S2_MAX_RETRIES,
@@ -128,7 +166,7 @@ def s2_get_citations(
     return _format_entries(entries, offset if offset else 0, total_count)
 
 
-def s2_get_references(
+async def s2_get_references(
     arxiv_id: str,
     offset: int = 0,
     limit: int = 50,
@@ -151,8 +189,11 @@ def s2_get_references(
 
     proxies_list = _load_proxy_list()
 
-    response = get_with_retries(
-        url, params=payload, num_retries=settings.S2_MAX_RETRIES, proxies_list=proxies_list
+    response = await _get(
+        url,
+        params=payload,
+        num_retries=settings.S2_MAX_RETRIES,
+        proxies_list=proxies_list,
     )
     result = response.json()
     entries = result["data"]
@@ -160,7 +201,7 @@ def s2_get_references(
     return _format_entries(entries, offset if offset else 0, total_count)
 
 
-def s2_get_info(arxiv_id: str) -> S2PaperInfo:
+async def s2_get_info(arxiv_id: str) -> S2PaperInfo:
     """
     Get the S2 info for a given arXiv ID.
 
@@ -171,16 +212,23 @@ def s2_get_info(arxiv_id: str) -> S2PaperInfo:
     if "v" in arxiv_id:
         arxiv_id = arxiv_id.split("v")[0]
     paper_id = f"arxiv:{arxiv_id}"
+    cached_info = _info_cache.get(paper_id)
+    if cached_info is not None:
+        return _copy_info(cached_info)
+
     payload = {"fields": FIELDS}
     paper_url = PAPER_URL_TEMPLATE.format(base_url=BASE_URL, paper_id=paper_id)
 
     proxies_list = _load_proxy_list()
 
-    response = get_with_retries(
-        paper_url, params=payload, num_retries=settings.S2_MAX_RETRIES, proxies_list=proxies_list
+    response = await _get(
+        paper_url,
+        params=payload,
+        num_retries=settings.S2_MAX_RETRIES,
+        proxies_list=proxies_list,
     )
     json_data = response.json()
-    return S2PaperInfo(
+    info = S2PaperInfo(
         arxiv_id=json_data.get("externalIds", {}).get("ArXiv"),
         external_ids=json_data.get("externalIds", {}),
         title=json_data["title"],
@@ -190,9 +238,11 @@ def s2_get_info(arxiv_id: str) -> S2PaperInfo:
         publication_date=str(json_data.get("publicationDate", "")),
         citation_styles=json_data.get("citationStyles", {}),
     )
+    _info_cache.set(paper_id, info)
+    return _copy_info(info)
 
 
-def s2_search(
+async def s2_search(
     query: str,
     offset: int = 0,
     limit: int = 5,
@@ -210,6 +260,11 @@ def s2_search(
         publication_date: Restricts results to the given range of publication dates or years (inclusive).
             Accepts the format <startDate>:<endDate> with each date in YYYY-MM-DD format. None by default.
     """
+    if publication_date:
+        assert PUBLICATION_DATE_RE.match(
+            publication_date
+        ), "Error: publication_date should be in <startDate>:<endDate> format, dates as YYYY[-MM[-DD]]"
+
     url = SEARCH_URL_TEMPLATE.format(base_url=BASE_URL)
     payload = {
         "query": query,
@@ -223,8 +278,12 @@ def s2_search(
 
     proxies_list = _load_proxy_list()
 
-    response = get_with_retries(
-        url, params=payload, backoff_factor=10.0, num_retries=5, proxies_list=proxies_list
+    response = await _get(
+        url,
+        params=payload,
+        backoff_factor=10.0,
+        num_retries=5,
+        proxies_list=proxies_list,
     )
     result = response.json()
     if "data" not in result:
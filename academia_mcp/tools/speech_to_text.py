@@ -2,9 +2,9 @@ from io import BytesIO
 from pathlib import Path
 
 import httpx
-from openai import AsyncOpenAI
 
 from academia_mcp.files import get_workspace_dir
+from academia_mcp.llm import get_async_client
 from academia_mcp.settings import settings
 
 
@@ -39,7 +39,7 @@ async def speech_to_text(audio_path: str, provider: str = "openai") -> str:
         audio_file.name = audio_path.split("/")[-1]
 
     assert provider == "openai"
-    client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+    client = get_async_client(api_key=settings.OPENAI_API_KEY)
     result = await client.audio.transcriptions.create(
         model="gpt-4o-transcribe",
         file=audio_file,
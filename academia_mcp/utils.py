@@ -1,13 +1,19 @@
+import functools
 import json
 import re
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Generic, Hashable, List, Optional, Tuple, TypeVar
 
 import requests
 from jinja2 import Template
 from urllib3.util.retry import Retry
 
+V = TypeVar("V")
+
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) "
@@ -15,6 +21,63 @@ USER_AGENT = (
 )
 
 
+class TTLCache(Generic[V]):
+    def __init__(self, ttl: float, max_size: int) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: OrderedDict[Hashable, Tuple[float, V]] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        cached_at, value = entry
+        if time.monotonic() - cached_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_thread_sessions = threading.local()
+
+
+def _get_session(num_retries: int, backoff_factor: float, method: str) -> requests.Session:
+    sessions: Optional[Dict[Tuple[int, float, str], requests.Session]] = getattr(
+        _thread_sessions, "sessions", None
+    )
+    if sessions is None:
+        sessions = {}
+        _thread_sessions.sessions = sessions
+    key = (num_retries, backoff_factor, method)
+    session = sessions.get(key)
+    if session is None:
+        retry_strategy = Retry(
+            total=num_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=[method],
+        )
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(max_retries=retry_strategy)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        sessions[key] = session
+    return session
+
+
 def post_with_retries(
     url: str,
     payload: Dict[str, Any],
@@ -23,17 +86,7 @@ def post_with_retries(
     num_retries: int = 3,
     backoff_factor: float = 3.0,
 ) -> requests.Response:
-    retry_strategy = Retry(
-        total=num_retries,
-        backoff_factor=backoff_factor,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["POST"],
-    )
-
-    session = requests.Session()
-    adapter = requests.adapters.HTTPAdapter(max_retries=retry_strategy)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
+    session = _get_session(num_retries, backoff_factor, "POST")
 
     headers = {
         "x-api-key": api_key,
@@ -42,7 +95,10 @@ def post_with_retries(
         "Content-Type": "application/json",
     }
 
-    response = session.post(url, headers=headers, json=payload, timeout=timeout)
+    try:
+        response = session.post(url, headers=headers, json=payload, timeout=timeout)
+    finally:
+        session.cookies.clear()
     response.raise_for_status()
     return response
 
@@ -56,17 +112,7 @@ def get_with_retries(
     params: Optional[Dict[str, Any]] = None,
     proxies_list: Optional[List[str]] = None,
 ) -> requests.Response:
-    retry_strategy = Retry(
-        total=num_retries,
-        backoff_factor=backoff_factor,
-        status_forcelist=[429, 500, 502, 503, 504],
-        allowed_methods=["GET"],
-    )
-
-    session = requests.Session()
-    adapter = requests.adapters.HTTPAdapter(max_retries=retry_strategy)
-    session.mount("https://", adapter)
-    session.mount("http://", adapter)
+    session = _get_session(num_retries, backoff_factor, "GET")
 
     headers = {}
     headers["Accept"] = "*/*"
@@ -81,7 +127,10 @@ def get_with_retries(
         proxy_url = secrets.choice(proxies_list)
         proxy = {"http": proxy_url, "https": proxy_url}
 
-    response = session.get(url, headers=headers, timeout=timeout, params=params, proxies=proxy)
+    try:
+        response = session.get(url, headers=headers, timeout=timeout, params=params, proxies=proxy)
+    finally:
+        session.cookies.clear()
     response.raise_for_status()
     return response
 
@@ -162,8 +211,13 @@ def extract_json(text: str) -> Any:
     return None
 
 
+@functools.lru_cache(maxsize=32)
+def _compile_template(template: str) -> Template:
+    return Template(template)
+
+
 def encode_prompt(template: str, **kwargs: Any) -> str:
-    template_obj = Template(template)
+    template_obj = _compile_template(template)
     return template_obj.render(**kwargs).strip()
 
 
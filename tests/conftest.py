@@ -1,15 +1,11 @@
 import asyncio
-import threading
-import time
-from contextlib import suppress
 from pathlib import Path
-from typing import Generator
+from typing import AsyncGenerator, Dict
 
+import httpx
 import pytest
-import uvicorn
-from sse_starlette.sse import AppStatus
+import pytest_asyncio
 
-from academia_mcp.server import create_server
 from academia_mcp.settings import settings
 
 settings.WORKSPACE_DIR = Path(__file__).parent / "workdir"
@@ -25,67 +21,64 @@ def test_audio_url() -> str:
     return "https://raw.githubusercontent.com/voxserv/audio_quality_testing_samples/refs/heads/master/testaudio/16000/test01_20s.wav"
 
 
-def reset_app_status() -> None:
-    AppStatus.should_exit = False
-    if hasattr(AppStatus, "should_exit_event"):
-        AppStatus.should_exit_event = None
+class MCPServerTest:
+    def __init__(self, base_url: str = "http://testserver") -> None:
+        from academia_mcp.server import add_shutdown_hooks, create_server
+
+        self.base_url = base_url
+        self.url = f"{base_url}/mcp"
+        self.server = create_server()
+        self.app = self.server.streamable_http_app()
+        add_shutdown_hooks(self.app)
+        self._task: asyncio.Task[None] | None = None
+        self._started = asyncio.Event()
+        self._should_exit = asyncio.Event()
+
+    def http_client(
+        self,
+        headers: Dict[str, str] | None = None,
+        timeout: httpx.Timeout | None = None,
+        auth: httpx.Auth | None = None,
+    ) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=self.app),
+            base_url=self.base_url,
+            headers=headers,
+            timeout=timeout,
+            auth=auth,
+        )
 
+    async def _serve(self) -> None:
+        async with self.app.router.lifespan_context(self.app):
+            self._started.set()
+            await self._should_exit.wait()
 
-class MCPServerTest:
-    def __init__(self, port: int, host: str = "0.0.0.0") -> None:
-        self.port = port
-        self.host = host
-        server = create_server(port=port, host=host)
-        app = server.streamable_http_app()
-        config = uvicorn.Config(
-            app,
-            host=host,
-            port=self.port,
-            log_level="error",
-            access_log=False,
-            lifespan="on",
-            ws="none",
+    async def start(self, timeout: float = 30.0) -> None:
+        self._task = asyncio.create_task(self._serve())
+        started = asyncio.create_task(self._started.wait())
+        await asyncio.wait(
+            {self._task, started}, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
         )
-        self.server: uvicorn.Server = uvicorn.Server(config)
-        self._thread: threading.Thread | None = None
-        self._started = threading.Event()
-
-    def start(self) -> None:
-        def _run() -> None:
-            async def _serve() -> None:
-                assert self.server is not None
-                await self.server.serve()
-
-            with suppress(asyncio.CancelledError):
-                asyncio.run(_serve())
-
-        self._thread = threading.Thread(target=_run, daemon=True)
-        self._thread.start()
-
-        deadline = time.time() + 30
-        while time.time() < deadline:
-            if self.server.started:
-                self._started.set()
-                break
-            time.sleep(0.05)
-        if not self._started.is_set():
-            raise RuntimeError("Mock MCP server failed to start within 30 s")
-
-    def stop(self) -> None:
-        if self.server:
-            self.server.should_exit = True
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=5)
-        reset_app_status()
-        self.app = None
+        if self._started.is_set():
+            return
+        started.cancel()
+        if self._task.done():
+            self._task.result()
+        self._task.cancel()
+        raise RuntimeError(f"Mock MCP server failed to start within {timeout} s")
+
+    async def stop(self) -> None:
+        self._should_exit.set()
+        if self._task is not None:
+            await self._task
 
     def is_running(self) -> bool:
-        return self._started.is_set() and self._thread is not None and self._thread.is_alive()
+        return self._started.is_set() and self._task is not None and not self._task.done()
 
 
-@pytest.fixture(scope="function")
-def mcp_server_test() -> Generator[MCPServerTest, None, None]:
-    server = MCPServerTest(port=6000)
-    server.start()
+@pytest_asyncio.fixture(scope="session")
+async def mcp_server_test() -> AsyncGenerator[MCPServerTest, None]:
+    server = MCPServerTest()
+    await server.start()
     yield server
-    server.stop()
+    await server.stop()
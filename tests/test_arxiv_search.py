@@ -1,6 +1,7 @@
 import pytest
 
 from academia_mcp.tools import arxiv_search
+from academia_mcp.tools.arxiv_search import arxiv_get_abstract
 
 
 def test_arxiv_search_basic_search() -> None:
@@ -114,3 +115,14 @@ def test_arxiv_search_point_e() -> None:
         include_abstracts=True,
     )
     assert "2212.08751" in str(result)
+
+
+def test_arxiv_get_abstract() -> None:
+    abstract = arxiv_get_abstract("2409.06820")
+    assert "role-playing" in abstract.lower()
+    assert "\n" not in abstract
+
+
+def test_arxiv_get_abstract_malformed_id() -> None:
+    with pytest.raises(AssertionError):
+        arxiv_get_abstract("not-an-arxiv-id")
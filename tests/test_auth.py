@@ -1,13 +1,25 @@
+import asyncio
+import threading
+import time
 from datetime import datetime, timedelta
+from typing import Dict, List, Optional
 
+import httpx
 import pytest
 from starlette.applications import Starlette
 from starlette.responses import JSONResponse
 from starlette.testclient import TestClient
 
-from academia_mcp.auth.middleware import BearerTokenAuthMiddleware
+from academia_mcp.auth.middleware import (
+    BearerTokenAuthMiddleware,
+    LastUsedBuffer,
+    TokenValidationCache,
+    last_used_buffer,
+    token_cache,
+)
 from academia_mcp.auth.models import TokenMetadata, TokenStore
 from academia_mcp.auth.token_manager import (
+    bulk_update_last_used,
     generate_token,
     issue_token,
     list_tokens,
@@ -184,6 +196,23 @@ def test_auth_revoke_token(tmp_path: object) -> None:
     assert store.tokens[metadata.token_id].revoked is True
 
 
+def test_auth_bulk_update_last_used(tmp_path: object) -> None:
+    tokens_file = tmp_path / "tokens.json"  # type: ignore
+
+    metadata1 = issue_token(client_id="client1", path=tokens_file)
+    metadata2 = issue_token(client_id="client2", path=tokens_file)
+    timestamp = datetime.utcnow()
+
+    bulk_update_last_used(
+        {metadata1.token_id: timestamp, "mcp_nonexistent": timestamp}, tokens_file
+    )
+
+    store = load_tokens(tokens_file)
+    assert store.tokens[metadata1.token_id].last_used == timestamp
+    assert store.tokens[metadata2.token_id].last_used is None
+    assert "mcp_nonexistent" not in store.tokens
+
+
 def test_auth_revoke_token_not_found(tmp_path: object) -> None:
     tokens_file = tmp_path / "tokens.json"  # type: ignore
 
@@ -212,6 +241,93 @@ async def test_auth_middleware_valid_token(tmp_path: object) -> None:
     assert response.json() == {"message": "success"}
 
 
+@pytest.mark.asyncio
+async def test_auth_middleware_records_last_used(tmp_path: object) -> None:
+    tokens_file = tmp_path / "tokens.json"  # type: ignore
+    settings.TOKENS_FILE = tokens_file
+
+    metadata = issue_token(client_id="test-client", path=tokens_file)
+
+    app = Starlette()
+    app.add_middleware(BearerTokenAuthMiddleware)
+
+    @app.route("/test")
+    async def test_endpoint(request: object) -> JSONResponse:
+        return JSONResponse({"message": "success"})
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        response = await client.get(
+            "/test", headers={"Authorization": f"Bearer {metadata.token_id}"}
+        )
+
+    assert response.status_code == 200
+    assert load_tokens(tokens_file).tokens[metadata.token_id].last_used is None
+
+    await last_used_buffer.flush()
+    assert load_tokens(tokens_file).tokens[metadata.token_id].last_used is not None
+
+
+def test_auth_middleware_uses_token_cache(
+    tmp_path: object, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    tokens_file = tmp_path / "tokens.json"  # type: ignore
+    settings.TOKENS_FILE = tokens_file
+
+    metadata = issue_token(client_id="test-client", path=tokens_file)
+    token_cache.clear()
+    validated: List[str] = []
+
+    def counting_validate_token(token: str) -> Optional[TokenMetadata]:
+        validated.append(token)
+        return validate_token(token)
+
+    monkeypatch.setattr("academia_mcp.auth.middleware.validate_token", counting_validate_token)
+
+    app = Starlette()
+    app.add_middleware(BearerTokenAuthMiddleware)
+
+    @app.route("/test")
+    async def test_endpoint(request: object) -> JSONResponse:
+        return JSONResponse({"message": "success"})
+
+    client = TestClient(app)
+    headers = {"Authorization": f"Bearer {metadata.token_id}"}
+    assert client.get("/test", headers=headers).status_code == 200
+    assert client.get("/test", headers=headers).status_code == 200
+    assert validated == [metadata.token_id]
+
+
+@pytest.mark.asyncio
+async def test_auth_last_used_buffer_close_during_flush(monkeypatch: pytest.MonkeyPatch) -> None:
+    started = threading.Event()
+    written: List[List[str]] = []
+    active = 0
+    peak = 0
+
+    def slow_bulk_update_last_used(last_used: Dict[str, datetime]) -> None:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        started.set()
+        time.sleep(0.2)
+        written.append(list(last_used))
+        active -= 1
+
+    monkeypatch.setattr(
+        "academia_mcp.auth.middleware.bulk_update_last_used", slow_bulk_update_last_used
+    )
+
+    buffer = LastUsedBuffer(flush_interval=0.01)
+    buffer.record("mcp_first")
+    assert await asyncio.to_thread(started.wait, 5.0)
+    buffer.record("mcp_second")
+    await buffer.close()
+
+    assert peak == 1
+    assert written == [["mcp_first"], ["mcp_second"]]
+
+
 @pytest.mark.asyncio
 async def test_auth_middleware_missing_header(tmp_path: object) -> None:
     app = Starlette()
@@ -243,6 +359,39 @@ async def test_auth_middleware_invalid_format(tmp_path: object) -> None:
     assert "Invalid Authorization header format" in response.json()["error"]
 
 
+@pytest.mark.asyncio
+async def test_auth_middleware_malformed_bearer(tmp_path: object) -> None:
+    app = Starlette()
+    app.add_middleware(BearerTokenAuthMiddleware)
+
+    @app.route("/test")
+    async def test_endpoint(request: object) -> JSONResponse:
+        return JSONResponse({"message": "success"})
+
+    client = TestClient(app)
+    oversized = "Bearer mcp_" + "a" * 1024
+    for header in ("Bearer", "Bearer ", "Bearer mcp_a mcp_b", "Basic mcp_token", oversized):
+        response = client.get("/test", headers={"Authorization": header})
+        assert response.status_code == 401
+        assert "Invalid Authorization header format" in response.json()["error"]
+
+
+@pytest.mark.asyncio
+async def test_auth_middleware_oversized_api_key(tmp_path: object) -> None:
+    app = Starlette()
+    app.add_middleware(BearerTokenAuthMiddleware)
+
+    @app.route("/test")
+    async def test_endpoint(request: object) -> JSONResponse:
+        return JSONResponse({"message": "success"})
+
+    client = TestClient(app)
+    response = client.get("/test", params={"apiKey": "mcp_" + "a" * 1024})
+
+    assert response.status_code == 401
+    assert "Invalid or expired token" in response.json()["error"]
+
+
 @pytest.mark.asyncio
 async def test_auth_middleware_expired_token(tmp_path: object) -> None:
     tokens_file = tmp_path / "tokens.json"  # type: ignore
@@ -287,3 +436,26 @@ async def test_auth_middleware_options_bypass(tmp_path: object) -> None:
     response = client.options("/test")
 
     assert response.status_code == 200
+
+
+def test_auth_token_cache_hit_and_expiry() -> None:
+    cache = TokenValidationCache(ttl=60.0, max_size=2)
+    metadata = TokenMetadata(token_id="mcp_cached", client_id="test-client")
+    assert cache.get("mcp_cached") is None
+
+    cache.set("mcp_cached", metadata)
+    cached = cache.get("mcp_cached")
+    assert cached is not None
+    assert cached.client_id == "test-client"
+
+    metadata.expires_at = datetime.utcnow() - timedelta(seconds=1)
+    assert cache.get("mcp_cached") is None
+
+
+def test_auth_token_cache_eviction() -> None:
+    cache = TokenValidationCache(ttl=60.0, max_size=2)
+    for index in range(3):
+        cache.set(f"mcp_{index}", TokenMetadata(token_id=f"mcp_{index}", client_id="c"))
+    assert cache.get("mcp_0") is None
+    assert cache.get("mcp_1") is not None
+    assert cache.get("mcp_2") is not None
@@ -0,0 +1,39 @@
+import asyncio
+import threading
+
+from openai import AsyncOpenAI
+
+from academia_mcp.llm import close_async_clients, get_async_client
+
+
+async def test_llm_async_client_reuse_and_close() -> None:
+    client = get_async_client(api_key="test", base_url="http://localhost")
+    assert get_async_client(api_key="test", base_url="http://localhost") is client
+    assert get_async_client(api_key="other", base_url="http://localhost") is not client
+
+    await close_async_clients()
+    assert client.is_closed()
+    assert get_async_client(api_key="test", base_url="http://localhost") is not client
+
+
+async def test_llm_async_client_closed_when_loop_changes() -> None:
+    other_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=other_loop.run_forever)
+    thread.start()
+
+    async def create_client() -> AsyncOpenAI:
+        return get_async_client(api_key="test", base_url="http://localhost")
+
+    try:
+        client = asyncio.run_coroutine_threadsafe(create_client(), other_loop).result()
+        assert get_async_client(api_key="test", base_url="http://localhost") is not client
+        for _ in range(100):
+            if client.is_closed():
+                break
+            await asyncio.sleep(0.01)
+        assert client.is_closed()
+    finally:
+        other_loop.call_soon_threadsafe(other_loop.stop)
+        thread.join()
+        other_loop.close()
+        await close_async_clients()
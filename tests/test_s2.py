@@ -1,29 +1,36 @@
+import asyncio
+from typing import Any, Callable, Dict, Tuple
+
+import pytest
+import pytest_asyncio
+
 from academia_mcp.tools import s2_get_citations, s2_get_info, s2_get_references, s2_search
+from academia_mcp.tools.s2 import S2SearchResponse
 
 
-def test_s2_citations_pingpong() -> None:
-    citations = s2_get_citations("2409.06820")
+async def test_s2_citations_pingpong() -> None:
+    citations = await s2_get_citations("2409.06820")
     assert citations.total_count >= 1
     assert "2502.18308" in str(citations.results)
 
 
-def test_s2_citations_transformers() -> None:
-    citations = s2_get_citations("1706.03762")
+async def test_s2_citations_transformers() -> None:
+    citations = await s2_get_citations("1706.03762")
     assert citations.total_count >= 100000
 
 
-def test_s2_citations_reversed() -> None:
-    citations = s2_get_references("1706.03762")
+async def test_s2_citations_reversed() -> None:
+    citations = await s2_get_references("1706.03762")
     assert citations.total_count <= 100
 
 
-def test_s2_citations_versions() -> None:
-    citations = s2_get_citations("2409.06820v4")
+async def test_s2_citations_versions() -> None:
+    citations = await s2_get_citations("2409.06820v4")
     assert citations.total_count >= 1
 
 
-def test_s2_get_info() -> None:
-    info = s2_get_info("2506.07296")
+async def test_s2_get_info() -> None:
+    info = await s2_get_info("2506.07296")
     assert info.title is not None
     assert info.authors is not None
     assert info.external_ids is not None
@@ -33,29 +40,60 @@ def test_s2_get_info() -> None:
     assert info.external_ids["CorpusId"] == 279251825
 
 
-def test_s2_search_base() -> None:
-    result = s2_search("transformers")
+def _check_search_base(result: S2SearchResponse) -> None:
     assert result.total_count >= 1
     assert "transformers" in str(result.results).lower()
     assert result.offset == 0
     assert result.returned_count == 5
 
 
-def test_s2_search_offset() -> None:
-    result = s2_search("transformers", offset=10)
+def _check_search_offset(result: S2SearchResponse) -> None:
     assert result.total_count >= 1
     assert "transformers" in str(result.results).lower()
     assert result.offset == 10
     assert result.returned_count == 5
 
 
-def test_s2_search_min_citation_count() -> None:
-    result = s2_search("transformers", min_citation_count=100000)
+def _check_search_min_citation_count(result: S2SearchResponse) -> None:
     assert result.total_count >= 2 and result.total_count <= 10
 
 
-def test_s2_search_publication_date() -> None:
-    result = s2_search(
-        "transformers", min_citation_count=100000, publication_date="2017-01-01:2017-12-31"
-    )
+def _check_search_publication_date(result: S2SearchResponse) -> None:
     assert result.total_count == 1
+
+
+SEARCH_CASES: Dict[str, Tuple[Dict[str, Any], Callable[[S2SearchResponse], None]]] = {
+    "base": ({}, _check_search_base),
+    "offset": ({"offset": 10}, _check_search_offset),
+    "min_citation_count": ({"min_citation_count": 100000}, _check_search_min_citation_count),
+    "publication_date": (
+        {"min_citation_count": 100000, "publication_date": "2017-01-01:2017-12-31"},
+        _check_search_publication_date,
+    ),
+}
+
+
+@pytest_asyncio.fixture(scope="module")
+async def s2_search_results() -> Dict[str, S2SearchResponse | BaseException]:
+    results = await asyncio.gather(
+        *[s2_search("transformers", **kwargs) for kwargs, _ in SEARCH_CASES.values()],
+        return_exceptions=True,
+    )
+    return dict(zip(SEARCH_CASES, results))
+
+
+@pytest.mark.parametrize("case_id", list(SEARCH_CASES))
+async def test_s2_search(
+    s2_search_results: Dict[str, S2SearchResponse | BaseException], case_id: str
+) -> None:
+    _, check = SEARCH_CASES[case_id]
+    result = s2_search_results[case_id]
+    if isinstance(result, BaseException):
+        raise result
+    check(result)
+
+
+async def test_s2_search_invalid_publication_date() -> None:
+    for publication_date in ("2017/01/01", "17-01-01:2017", "2017-01-01 to 2017-12-31", ":"):
+        with pytest.raises(AssertionError):
+            await s2_search("transformers", publication_date=publication_date)
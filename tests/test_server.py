@@ -8,10 +8,9 @@ from tests.conftest import MCPServerTest
 
 
 async def call_tool(mcp_server_test: MCPServerTest, tool: str, kwargs: Dict[str, Any]) -> Any:
-    # Use 127.0.0.1 for client connections (0.0.0.0 is only for server binding)
-    client_host = "127.0.0.1" if mcp_server_test.host == "0.0.0.0" else mcp_server_test.host
-    url = f"http://{client_host}:{mcp_server_test.port}/mcp"
-    async with streamablehttp_client(url) as (
+    async with streamablehttp_client(
+        mcp_server_test.url, httpx_client_factory=mcp_server_test.http_client
+    ) as (
         read_stream,
         write_stream,
         _,
@@ -23,11 +22,10 @@ async def call_tool(mcp_server_test: MCPServerTest, tool: str, kwargs: Dict[str,
 
 
 async def fetch_tools(mcp_server_test: MCPServerTest) -> List[Tool]:
-    # Use 127.0.0.1 for client connections (0.0.0.0 is only for server binding)
-    client_host = "127.0.0.1" if mcp_server_test.host == "0.0.0.0" else mcp_server_test.host
-    url = f"http://{client_host}:{mcp_server_test.port}/mcp"
     all_tools: List[Tool] = []
-    async with streamablehttp_client(url) as (
+    async with streamablehttp_client(
+        mcp_server_test.url, httpx_client_factory=mcp_server_test.http_client
+    ) as (
         read_stream,
         write_stream,
         _,
@@ -39,7 +37,7 @@ async def fetch_tools(mcp_server_test: MCPServerTest) -> List[Tool]:
     return all_tools
 
 
-def test_server_run(mcp_server_test: MCPServerTest) -> None:
+async def test_server_run(mcp_server_test: MCPServerTest) -> None:
     assert mcp_server_test.server is not None
     assert mcp_server_test.is_running()
 
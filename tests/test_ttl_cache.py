@@ -0,0 +1,37 @@
+import time
+
+from academia_mcp.utils import TTLCache
+
+
+def test_ttl_cache_hit_and_expiry() -> None:
+    cache: TTLCache[str] = TTLCache(ttl=0.05, max_size=2)
+    assert cache.get("key") is None
+
+    cache.set("key", "value")
+    assert cache.get("key") == "value"
+
+    time.sleep(0.1)
+    assert cache.get("key") is None
+
+
+def test_ttl_cache_eviction() -> None:
+    cache: TTLCache[int] = TTLCache(ttl=60.0, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_delete_and_clear() -> None:
+    cache: TTLCache[int] = TTLCache(ttl=60.0, max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.delete("a")
+    cache.delete("missing")
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    cache.clear()
+    assert cache.get("b") is None